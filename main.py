@@ -5,6 +5,7 @@ Main Orchestration Module
 This is the entry point for the negotiation simulation.
 """
 
+import asyncio
 import uuid
 import logging
 from datetime import datetime
@@ -218,6 +219,83 @@ def print_negotiation_result(negotiation: NegotiationState):
         console.print(history_table)
 
 
+async def arun_negotiation(
+    order: Order,
+    world: WorldState,
+    warehouse: WarehouseAgent,
+    carrier: CarrierAgent,
+    max_rounds: int = 5
+) -> NegotiationState:
+    """
+    Async variant of run_negotiation.
+
+    Drives the compiled graph with ainvoke so several independent
+    negotiations can overlap their LLM round-trips under asyncio.gather.
+    Skips the per-step console narration - use run_negotiation for the
+    interactive demo.
+    """
+    negotiation = NegotiationState(
+        negotiation_id=f"NEG-{uuid.uuid4().hex[:8]}",
+        order=order,
+        warehouse_id=warehouse.agent_id,
+        carrier_id=carrier.agent_id,
+        max_rounds=max_rounds
+    )
+    
+    initial_state = GraphState(
+        negotiation=negotiation,
+        current_speaker=AgentType.WAREHOUSE,
+        messages=[]
+    )
+    
+    graph = create_negotiation_graph(warehouse, carrier, world)
+    config = {"configurable": {"thread_id": negotiation.negotiation_id}}
+    final_state = await graph.ainvoke(initial_state, config)
+    _release_negotiation_thread(graph, negotiation.negotiation_id)
+    
+    if isinstance(final_state, dict):
+        final_negotiation = final_state.get('negotiation', negotiation)
+        if isinstance(final_negotiation, dict):
+            final_negotiation = NegotiationState(**final_negotiation)
+    else:
+        final_negotiation = final_state.negotiation
+    
+    final_negotiation.completed_at = datetime.now()
+    
+    if final_negotiation.final_status == NegotiationStatus.ACCEPTED:
+        _record_negotiation_deal(final_negotiation, warehouse)
+    
+    return final_negotiation
+
+
+def run_negotiations_concurrently(
+    batch: list,
+    world: WorldState,
+    max_rounds: int = 5
+) -> list:
+    """
+    Run a batch of independent negotiations concurrently.
+    
+    Args:
+        batch: List of (order, warehouse, carrier) tuples
+        world: Shared world state
+        max_rounds: Maximum rounds per negotiation
+    
+    Returns:
+        List of completed NegotiationState objects, in batch order.
+    
+    Wall time is roughly the slowest negotiation rather than the sum,
+    since the LLM round-trips overlap.
+    """
+    async def _drive():
+        return await asyncio.gather(*[
+            arun_negotiation(order, world, warehouse, carrier, max_rounds)
+            for order, warehouse, carrier in batch
+        ])
+    
+    return asyncio.run(_drive())
+
+
 def run_negotiation(
     order: Order,
     world: WorldState,
@@ -243,8 +321,6 @@ def run_negotiation(
     # Create initial graph state
     initial_state = GraphState(
         negotiation=negotiation,
-        warehouse_state=warehouse.state,
-        carrier_state=carrier.state,
         current_speaker=AgentType.WAREHOUSE,
         messages=[]
     )
@@ -255,9 +331,10 @@ def run_negotiation(
     console.print(f"\n⏳ Running negotiation (max {max_rounds} rounds)...\n")
     console.print("-" * 70)
     
-    # Execute the graph
+    # Execute the graph (thread_id lets a retry resume from the checkpoint)
+    config = {"configurable": {"thread_id": negotiation.negotiation_id}}
     final_state = None
-    for state in graph.stream(initial_state):
+    for state in graph.stream(initial_state, config):
         # The state is a dict with node name as key
         for node_name, node_state in state.items():
             # node_state might be a dict or GraphState depending on LangGraph version
@@ -276,6 +353,8 @@ def run_negotiation(
     
     console.print("-" * 70)
     
+    _release_negotiation_thread(graph, negotiation.negotiation_id)
+    
     if final_state:
         # Handle both dict and object access
         if isinstance(final_state, dict):
@@ -302,6 +381,22 @@ def run_negotiation(
     return negotiation
 
 
+def _release_negotiation_thread(graph, negotiation_id: str):
+    """
+    Drop a finished negotiation's checkpoints from the graph's saver.
+
+    The compiled graph (and its MemorySaver) is cached for the life of
+    the process, so without this every run would leave its per-round
+    checkpoints behind forever. Checkpoints still survive for in-flight
+    or failed runs, which is all retry-resume needs.
+    """
+    try:
+        graph.checkpointer.delete_thread(negotiation_id)
+    except AttributeError:
+        # Older langgraph without delete_thread; nothing to free
+        pass
+
+
 def _record_negotiation_deal(negotiation: NegotiationState, warehouse: WarehouseAgent):
     """
     Record a completed negotiation as a DealHistory.
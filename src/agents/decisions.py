@@ -0,0 +1,86 @@
+"""
+Rule-Based Decision Kernels for MA-GET
+Pure-float negotiation math, optionally JIT-compiled with Numba.
+
+The branching here mirrors the agents' rule-based response logic but
+operates only on scalars, so Numba can compile it to machine code when
+installed (`pip install numba`). Without Numba the plain-Python functions
+run unchanged - the agents never need to care which variant they got.
+"""
+
+from src.core.optional_jit import maybe_njit
+
+# Status codes returned by the kernels (plain ints so Numba can compile them)
+ACCEPT = 0
+COUNTER = 1
+REJECT = 2
+
+
+@maybe_njit(cache=True)
+def carrier_decide(
+    offered: float,
+    fuel_cost: float,
+    minimum_price: float,
+    target_price: float,
+    current_round: int,
+    max_rounds: int
+):
+    """
+    Carrier accept/counter/reject decision with diminishing demands.
+
+    Returns (status_code, counter_price, confidence, adjusted_minimum,
+    adjusted_target); the adjusted thresholds let the caller build its
+    explanation string without redoing the math.
+    """
+    rounds_left = max_rounds - current_round
+    rl_ratio = rounds_left / max_rounds
+
+    flexibility = 1.0 - 0.3 * rl_ratio  # More flexible as rounds progress
+    adjusted_minimum = minimum_price * (0.9 + 0.1 * rl_ratio)
+    adjusted_target = target_price * flexibility
+
+    if offered >= adjusted_target:
+        return ACCEPT, offered, 0.95, adjusted_minimum, adjusted_target
+
+    if offered < adjusted_minimum:
+        if rounds_left <= 1:
+            # Last round, accept if above absolute minimum
+            if offered >= minimum_price * 0.9:
+                return ACCEPT, offered, 0.6, adjusted_minimum, adjusted_target
+            return REJECT, minimum_price, 0.8, adjusted_minimum, adjusted_target
+        return COUNTER, adjusted_target * 0.95, 0.7, adjusted_minimum, adjusted_target
+
+    # Between minimum and target - find middle ground
+    return COUNTER, (offered + adjusted_target) / 2, 0.75, adjusted_minimum, adjusted_target
+
+
+@maybe_njit(cache=True)
+def warehouse_decide(
+    offered: float,
+    max_budget: float,
+    min_price: float,
+    max_price: float,
+    current_round: int,
+    max_rounds: int
+):
+    """
+    Warehouse accept/counter decision with urgency-scaled thresholds.
+
+    Returns (status_code, counter_price, confidence, acceptable_price,
+    urgency).
+    """
+    rounds_left = max_rounds - current_round
+    urgency = 1.0 - (rounds_left / max_rounds)
+    acceptable_price = min_price + (max_price - min_price) * (0.5 + urgency * 0.3)
+
+    if offered <= acceptable_price and offered <= max_budget:
+        return ACCEPT, offered, 0.9, acceptable_price, urgency
+
+    if offered > max_budget:
+        counter_price = min(max_budget * 0.95, max_price)
+        return COUNTER, counter_price, 0.6, acceptable_price, urgency
+
+    counter_price = offered * (0.85 + urgency * 0.1)
+    counter_price = min(counter_price, max_budget)
+    return COUNTER, counter_price, 0.7, acceptable_price, urgency
+
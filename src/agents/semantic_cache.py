@@ -0,0 +1,179 @@
+"""
+Semantic LLM Response Cache for MA-GET
+Second cache tier behind the exact-hash LRU in BaseAgent.
+
+Negotiation prompts are nearly identical across rounds - only small float
+fields (budget remaining, round number, prices) change - so the exact-hash
+cache misses most of the time. This tier embeds the dynamic part of the
+prompt once and returns a cached response when the cosine similarity to a
+previously seen prompt exceeds a threshold.
+
+Opt-in via MAGET_SEMANTIC_CACHE=1 (needs OPENAI_API_KEY for the embedding
+model). The similarity threshold can be tuned with
+MAGET_SEMANTIC_CACHE_THRESHOLD (default 0.98). Entries persist in a local
+SQLite database so hits survive across runs.
+"""
+
+import os
+import sqlite3
+import logging
+from pathlib import Path
+from typing import Optional
+
+# NumPy powers the flat cosine-similarity search (the index is small enough
+# that a brute-force matrix product beats a dedicated ANN library here)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger("MA-GET")
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SEMANTIC_CACHE_ENABLED = os.getenv("MAGET_SEMANTIC_CACHE", "0") == "1"
+SIMILARITY_THRESHOLD = float(os.getenv("MAGET_SEMANTIC_CACHE_THRESHOLD", "0.98"))
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIM = 256
+
+# Database location (same directory as this file)
+DB_PATH = Path(__file__).parent / "semantic_cache.db"
+
+
+# =============================================================================
+# SEMANTIC CACHE
+# =============================================================================
+
+class SemanticCache:
+    """
+    Embedding-based response cache with a SQLite backing store.
+
+    Vectors are L2-normalized at insert time, so lookup is a single
+    matrix-vector product followed by argmax.
+    """
+
+    def __init__(self, db_path: Path = DB_PATH, threshold: float = SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self._embedder = None  # Created lazily on first use
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS semantic_cache (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                prompt_text TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                response TEXT NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        self._conn.commit()
+
+        # In-memory copy of the index: (N, EMBEDDING_DIM) float32 matrix
+        self._vectors: Optional["np.ndarray"] = None
+        self._responses: list = []
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """Load persisted embeddings into the in-memory search matrix."""
+        rows = self._conn.execute(
+            "SELECT embedding, response FROM semantic_cache ORDER BY id"
+        ).fetchall()
+
+        self._responses = [response for _, response in rows]
+        if rows:
+            self._vectors = np.stack([
+                np.frombuffer(blob, dtype=np.float32) for blob, _ in rows
+            ])
+        else:
+            self._vectors = np.empty((0, EMBEDDING_DIM), dtype=np.float32)
+
+        if self._responses:
+            logger.debug(f"Semantic cache loaded {len(self._responses)} entries")
+
+    def _get_embedder(self):
+        """Lazily construct the embedding client."""
+        if self._embedder is None:
+            from langchain_openai import OpenAIEmbeddings
+            self._embedder = OpenAIEmbeddings(
+                model=EMBEDDING_MODEL,
+                dimensions=EMBEDDING_DIM
+            )
+        return self._embedder
+
+    def _embed(self, text: str) -> Optional["np.ndarray"]:
+        """Embed text and L2-normalize; returns None if embedding fails."""
+        try:
+            vector = np.asarray(
+                self._get_embedder().embed_query(text), dtype=np.float32
+            )
+            norm = np.linalg.norm(vector)
+            if norm == 0:
+                return None
+            return vector / norm
+        except Exception as e:
+            logger.debug(f"Semantic cache embedding failed: {e}")
+            return None
+
+    def lookup(self, text: str):
+        """
+        Look up the nearest cached prompt.
+
+        Returns (response, embedding): response is None on a miss, and the
+        embedding (or None) can be passed to insert() to avoid re-embedding.
+        """
+        embedding = self._embed(text)
+        if embedding is None or len(self._responses) == 0:
+            return None, embedding
+
+        similarities = self._vectors @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            return self._responses[best], embedding
+
+        return None, embedding
+
+    def insert(self, text: str, response: str, embedding: Optional["np.ndarray"] = None) -> None:
+        """Persist a prompt/response pair and add it to the search matrix."""
+        if embedding is None:
+            embedding = self._embed(text)
+        if embedding is None:
+            return
+
+        self._conn.execute(
+            "INSERT INTO semantic_cache (prompt_text, embedding, response) VALUES (?, ?, ?)",
+            (text, embedding.tobytes(), response)
+        )
+        self._conn.commit()
+
+        self._vectors = np.vstack([self._vectors, embedding[np.newaxis, :]])
+        self._responses.append(response)
+
+
+# =============================================================================
+# SINGLETON ACCESS
+# =============================================================================
+
+_cache_instance: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Return the shared SemanticCache, or None when the tier is unavailable
+    (disabled via env, NumPy missing, or initialization failed).
+    """
+    global _cache_instance
+
+    if not (SEMANTIC_CACHE_ENABLED and NUMPY_AVAILABLE):
+        return None
+
+    if _cache_instance is None:
+        try:
+            _cache_instance = SemanticCache()
+        except Exception as e:
+            logger.warning(f"Semantic cache unavailable: {e}")
+            return None
+
+    return _cache_instance
@@ -5,6 +5,8 @@ SQLite database for persisting agent deal history and reputation scores.
 
 import sqlite3
 import json
+import threading
+from contextlib import contextmanager
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +17,60 @@ from src.core.schema import DealHistory, ReputationScore, AgentType, DealOutcome
 # Database file path
 DB_PATH = Path(__file__).parent / "deal_history.db"
 
+# Connection of the enclosing transaction() block, if any. Write helpers
+# reuse it so several writes share one commit (one fsync) instead of
+# opening and committing their own connections. Thread-local: sqlite3
+# connections must stay on their creating thread, and reads dispatched to
+# worker threads (e.g. via asyncio.to_thread) must not be pulled into a
+# transaction open on another thread.
+_tx_local = threading.local()
+
+
+@contextmanager
+def transaction():
+    """
+    Group several database writes into a single transaction.
+
+    Usage:
+        with db.transaction():
+            db.save_deal_history(deal)
+            db.update_reputation_from_deal(deal)
+
+    Everything inside commits (and fsyncs) once on exit; any exception
+    rolls the whole block back. Nested blocks reuse the outer connection.
+    """
+    existing = getattr(_tx_local, "conn", None)
+    if existing is not None:
+        yield existing
+        return
+
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("BEGIN IMMEDIATE")
+    _tx_local.conn = conn
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        _tx_local.conn = None
+        conn.close()
+
+
+def _acquire() -> tuple:
+    """
+    Return (connection, owned).
+
+    Inside a transaction() block on the current thread this hands back
+    the shared connection with owned=False; otherwise a fresh connection
+    the caller must commit/close itself.
+    """
+    conn = getattr(_tx_local, "conn", None)
+    if conn is not None:
+        return conn, False
+    return sqlite3.connect(DB_PATH), True
+
 
 def init_database():
     """Initialize the database with required tables."""
@@ -89,7 +145,7 @@ def save_deal_history(deal: DealHistory) -> bool:
         True if successful, False otherwise
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn, owned = _acquire()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -114,8 +170,9 @@ def save_deal_history(deal: DealHistory) -> bool:
             deal.completed_at.isoformat() if deal.completed_at else None
         ))
         
-        conn.commit()
-        conn.close()
+        if owned:
+            conn.commit()
+            conn.close()
         return True
         
     except Exception as e:
@@ -189,6 +246,122 @@ def load_deal_history(
         return []
 
 
+def load_deal_statistics(limit: int = 50) -> Optional[Dict[str, Any]]:
+    """
+    Aggregate the most recent deals directly in SQLite.
+
+    Produces the same statistics dict the auditor builds from DealHistory
+    objects — grouped carrier/warehouse sums, success rate, price trend —
+    plus an "analysis_period" block, without materializing a model
+    instance per row. A handful of scalar rows cross the C boundary
+    instead of limit × a dozen attribute conversions.
+
+    Args:
+        limit: Size of the recent-deals window to aggregate
+
+    Returns:
+        Statistics dict, or None when the table is empty or the query
+        fails (callers fall back to the object-loading path)
+    """
+    recent = """
+        SELECT carrier_id, warehouse_id, agreed_price, negotiation_rounds,
+               outcome, timestamp
+        FROM deal_history ORDER BY timestamp DESC LIMIT ?
+    """
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+
+        cursor.execute(f"""
+            SELECT COUNT(*), SUM(agreed_price), SUM(negotiation_rounds),
+                   SUM(CASE WHEN outcome = 'SUCCESS' THEN 1 ELSE 0 END),
+                   MIN(timestamp), MAX(timestamp)
+            FROM ({recent})
+        """, (limit,))
+        total, total_value, total_rounds, successful, start_date, end_date = cursor.fetchone()
+        if not total:
+            conn.close()
+            return None
+
+        cursor.execute(f"""
+            SELECT carrier_id, COUNT(*), SUM(agreed_price),
+                   SUM(CASE WHEN outcome = 'SUCCESS' THEN 1 ELSE 0 END)
+            FROM ({recent})
+            GROUP BY carrier_id ORDER BY MAX(timestamp) DESC
+        """, (limit,))
+        carrier_stats = {}
+        for carrier_id, count, value, succ in cursor.fetchall():
+            carrier_stats[carrier_id] = {
+                "total_deals": count,
+                "total_value": value,
+                "successful": succ,
+                "failed": count - succ,
+                "avg_rounds": 0.0,
+                "win_rate": succ / count,
+                "avg_deal_value": value / count
+            }
+
+        cursor.execute(f"""
+            SELECT warehouse_id, COUNT(*), SUM(agreed_price)
+            FROM ({recent})
+            GROUP BY warehouse_id ORDER BY MAX(timestamp) DESC
+        """, (limit,))
+        warehouse_stats = {}
+        for warehouse_id, count, spent in cursor.fetchall():
+            warehouse_stats[warehouse_id] = {
+                "total_deals": count,
+                "total_spent": spent,
+                "avg_price": spent / count
+            }
+
+        # Price trend: last 10 deals vs the 10 before them
+        price_trend = "stable"
+        change_pct = 0.0
+        if total >= 20:
+            cursor.execute(f"""
+                SELECT AVG(agreed_price) FROM (
+                    SELECT agreed_price FROM ({recent}) LIMIT 10
+                )
+            """, (limit,))
+            recent_avg = cursor.fetchone()[0]
+            cursor.execute(f"""
+                SELECT AVG(agreed_price) FROM (
+                    SELECT agreed_price FROM ({recent}) LIMIT 10 OFFSET 10
+                )
+            """, (limit,))
+            previous_avg = cursor.fetchone()[0]
+            if previous_avg:
+                change_pct = ((recent_avg - previous_avg) / previous_avg) * 100
+                if change_pct > 10:
+                    price_trend = "rising"
+                elif change_pct < -10:
+                    price_trend = "falling"
+
+        conn.close()
+
+        return {
+            "total_deals_analyzed": total,
+            "total_market_value": total_value,
+            "average_deal_value": total_value / total,
+            "success_rate": successful / total,
+            "average_negotiation_rounds": total_rounds / total,
+            "carrier_performance": carrier_stats,
+            "warehouse_performance": warehouse_stats,
+            "price_trend": price_trend,
+            "price_change_pct": change_pct,
+            "market_competition": len(carrier_stats),
+            "analysis_period": {
+                "total_deals": total,
+                "start_date": start_date,
+                "end_date": end_date
+            }
+        }
+
+    except Exception as e:
+        print(f"❌ Error loading deal statistics: {e}")
+        return None
+
+
 def get_agent_deal_history(
     agent_id: str,
     limit: int = 50
@@ -217,7 +390,7 @@ def save_reputation_score(reputation: ReputationScore) -> bool:
         True if successful, False otherwise
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn, owned = _acquire()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -240,8 +413,9 @@ def save_reputation_score(reputation: ReputationScore) -> bool:
             reputation.last_updated.isoformat()
         ))
         
-        conn.commit()
-        conn.close()
+        if owned:
+            conn.commit()
+            conn.close()
         return True
         
     except Exception as e:
@@ -249,6 +423,23 @@ def save_reputation_score(reputation: ReputationScore) -> bool:
         return False
 
 
+def _reputation_from_row(row) -> ReputationScore:
+    """Convert a reputation_scores row into a ReputationScore model."""
+    return ReputationScore(
+        agent_id=row[0],
+        agent_type=AgentType(row[1]),
+        total_deals=row[2],
+        successful_deals=row[3],
+        failed_deals=row[4],
+        overall_score=row[5],
+        reliability_score=row[6],
+        negotiation_fairness=row[7],
+        avg_negotiation_rounds=row[8],
+        on_time_percentage=row[9],
+        last_updated=datetime.fromisoformat(row[10])
+    )
+
+
 def load_reputation_score(agent_id: str) -> Optional[ReputationScore]:
     """
     Load an agent's reputation score from the database.
@@ -260,7 +451,7 @@ def load_reputation_score(agent_id: str) -> Optional[ReputationScore]:
         ReputationScore object or None if not found
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn, owned = _acquire()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -268,22 +459,11 @@ def load_reputation_score(agent_id: str) -> Optional[ReputationScore]:
         """, (agent_id,))
         
         row = cursor.fetchone()
-        conn.close()
+        if owned:
+            conn.close()
         
         if row:
-            return ReputationScore(
-                agent_id=row[0],
-                agent_type=AgentType(row[1]),
-                total_deals=row[2],
-                successful_deals=row[3],
-                failed_deals=row[4],
-                overall_score=row[5],
-                reliability_score=row[6],
-                negotiation_fairness=row[7],
-                avg_negotiation_rounds=row[8],
-                on_time_percentage=row[9],
-                last_updated=datetime.fromisoformat(row[10])
-            )
+            return _reputation_from_row(row)
         
         return None
         
@@ -292,7 +472,95 @@ def load_reputation_score(agent_id: str) -> Optional[ReputationScore]:
         return None
 
 
-def update_reputation_from_deal(deal: DealHistory) -> bool:
+def get_or_create_reputation_score(agent_id: str, agent_type: AgentType) -> ReputationScore:
+    """
+    Fetch an agent's reputation, inserting the default row if absent.
+
+    One upsert round-trip replaces the load / if-None / save dance: the
+    no-op DO UPDATE makes RETURNING fire on conflict too, so the existing
+    row comes back untouched.
+
+    Args:
+        agent_id: The agent's ID
+        agent_type: Agent type used when creating the default row
+
+    Returns:
+        The existing or freshly created ReputationScore
+    """
+    default = ReputationScore(agent_id=agent_id, agent_type=agent_type)
+    try:
+        conn, owned = _acquire()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            INSERT INTO reputation_scores (
+                agent_id, agent_type, total_deals, successful_deals, failed_deals,
+                overall_score, reliability_score, negotiation_fairness,
+                avg_negotiation_rounds, on_time_percentage, last_updated
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(agent_id) DO UPDATE SET agent_id = excluded.agent_id
+            RETURNING *
+        """, (
+            default.agent_id,
+            default.agent_type.value,
+            default.total_deals,
+            default.successful_deals,
+            default.failed_deals,
+            default.overall_score,
+            default.reliability_score,
+            default.negotiation_fairness,
+            default.avg_negotiation_rounds,
+            default.on_time_percentage,
+            default.last_updated.isoformat()
+        ))
+
+        row = cursor.fetchone()
+        if owned:
+            conn.commit()
+            conn.close()
+
+        return _reputation_from_row(row) if row else default
+
+    except Exception as e:
+        print(f"❌ Error getting or creating reputation score: {e}")
+        return default
+
+
+def load_reputation_scores(agent_ids: List[str]) -> Dict[str, ReputationScore]:
+    """
+    Load reputation scores for several agents in one query.
+
+    Args:
+        agent_ids: Agent IDs to look up
+
+    Returns:
+        Dict of ReputationScore keyed by agent_id; missing agents are
+        simply absent from the dict
+    """
+    if not agent_ids:
+        return {}
+
+    try:
+        conn, owned = _acquire()
+        cursor = conn.cursor()
+
+        placeholders = ",".join("?" for _ in agent_ids)
+        cursor.execute(
+            f"SELECT * FROM reputation_scores WHERE agent_id IN ({placeholders})",
+            list(agent_ids)
+        )
+        rows = cursor.fetchall()
+        if owned:
+            conn.close()
+
+        return {row[0]: _reputation_from_row(row) for row in rows}
+
+    except Exception as e:
+        print(f"❌ Error loading reputation scores: {e}")
+        return {}
+
+
+def update_reputation_from_deal(deal: DealHistory) -> Optional[Dict[str, ReputationScore]]:
     """
     Update reputation scores for both agents involved in a deal.
     
@@ -300,7 +568,8 @@ def update_reputation_from_deal(deal: DealHistory) -> bool:
         deal: The completed deal
         
     Returns:
-        True if successful, False otherwise
+        Dict of the updated scores keyed by agent_id (truthy on success,
+        so existing boolean checks keep working), or None on error
     """
     try:
         # Update warehouse reputation
@@ -363,11 +632,15 @@ def update_reputation_from_deal(deal: DealHistory) -> bool:
         save_reputation_score(warehouse_rep)
         save_reputation_score(carrier_rep)
         
-        return True
+        # Hand the fresh scores back so callers skip a follow-up SELECT
+        return {
+            warehouse_rep.agent_id: warehouse_rep,
+            carrier_rep.agent_id: carrier_rep
+        }
         
     except Exception as e:
         print(f"❌ Error updating reputation from deal: {e}")
-        return False
+        return None
 
 
 def get_top_agents(
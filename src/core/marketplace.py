@@ -12,7 +12,7 @@ from src.core.schema import (
     Order, MarketplaceAuction, NegotiationOffer, NegotiationStatus,
     AgentType
 )
-from src.agents.agents import WarehouseAgent, CarrierAgent
+from src.agents.agents import WarehouseAgent, CarrierAgent, create_initial_bids_batch
 from src.core.world import WorldState
 from src.core import deal_database as db
 
@@ -146,21 +146,31 @@ class MarketplaceOrchestrator:
         auction_id: str
     ) -> List[NegotiationOffer]:
         """Collect bids from all carriers in parallel."""
+        # One vectorized pass prices every carrier's bid together
+        try:
+            bids = create_initial_bids_batch(carriers, order, self.world, auction_id)
+            for carrier, bid in zip(carriers, bids):
+                bid.recipient_id = order.origin  # Set warehouse location as recipient
+                print(f"  ✓ Bid received from {carrier.state.company_name} ({carrier.agent_id})")
+                print(f"    └─ Price: ${bid.offer_price:.2f}, ETA: {bid.eta_estimate:.1f}h\n")
+            return bids
+        except Exception as e:
+            logger.error(f"Batch bid collection failed, retrying per carrier: {e}")
+
         bids = []
-        
         for carrier in carriers:
             try:
                 bid = carrier.create_initial_bid(order, self.world, auction_id)
                 bid.recipient_id = order.origin  # Set warehouse location as recipient
                 bids.append(bid)
-                
+
                 print(f"  ✓ Bid received from {carrier.state.company_name} ({carrier.agent_id})")
                 print(f"    └─ Price: ${bid.offer_price:.2f}, ETA: {bid.eta_estimate:.1f}h\n")
-                
+
             except Exception as e:
                 logger.error(f"Failed to get bid from {carrier.agent_id}: {e}")
                 print(f"  ✗ Failed to get bid from {carrier.agent_id}: {e}\n")
-        
+
         return bids
     
     def _log_bids(self, bids: List[NegotiationOffer]):
@@ -0,0 +1,51 @@
+"""
+Optional Numba JIT Helper for MA-GET
+
+Numba is an optional dependency: when installed, the numeric kernels get
+compiled to machine code; when absent, the plain-Python functions run
+unchanged. This module centralizes the try/except dance so each kernel
+module applies one decorator instead of repeating the import guard.
+"""
+
+from typing import Callable
+
+try:
+    from numba import njit as _njit
+    HAS_NUMBA = True
+except ImportError:
+    _njit = None
+    HAS_NUMBA = False
+
+
+def maybe_njit(*args, **kwargs) -> Callable:
+    """
+    njit when Numba is available, identity otherwise.
+
+    Usable bare (``@maybe_njit``) or with options
+    (``@maybe_njit(cache=True)``). cache=True is the recommended default
+    here so only the first process ever pays the compile cost.
+    """
+    if args and callable(args[0]):
+        # Bare @maybe_njit usage
+        func = args[0]
+        return _njit(func) if HAS_NUMBA else func
+
+    def decorate(func: Callable) -> Callable:
+        return _njit(*args, **kwargs)(func) if HAS_NUMBA else func
+    return decorate
+
+
+def warm_up(*calls) -> None:
+    """
+    Trigger compilation ahead of the hot path.
+
+    Each argument is a zero-arg callable invoking a jitted kernel with
+    representative dummy arguments. No-op without Numba, where there is
+    nothing to compile. Call during startup (not import) so simulations
+    pay the cold-start before their first negotiation rather than inside
+    it; with cache=True this is near-instant after the first run.
+    """
+    if not HAS_NUMBA:
+        return
+    for call in calls:
+        call()
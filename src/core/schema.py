@@ -3,11 +3,19 @@ Schema definitions for MA-GET (Multi-Agent Generative Economic Twin)
 Pydantic models for structured agent communication and world state.
 """
 
+from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, List, Dict
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+# NumPy backs the structure-of-arrays NegotiationBatch view (optional)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 # =============================================================================
 # ENUMS
@@ -207,6 +215,54 @@ class NegotiationResponse(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
+@dataclass(slots=True)
+class OfferView:
+    """
+    Validation-free scalar view of an offer's hot numeric fields.
+
+    The Pydantic models above stay the boundary format (validation,
+    serialization, event logs); batch pricing code that only needs the
+    numbers should work on these views instead of full offers.
+    """
+    price: float
+    eta: float
+
+    @classmethod
+    def from_offer(cls, offer: "NegotiationOffer") -> "OfferView":
+        return cls(price=offer.offer_price, eta=offer.eta_estimate)
+
+
+class NegotiationBatch:
+    """
+    Structure-of-arrays view over a set of offers for vectorized math.
+
+    Prices and ETAs are packed into float32 arrays (half the memory
+    traffic of float64) with offer IDs kept as a parallel list so results
+    can be mapped back to the Pydantic objects afterwards. Falls back to
+    plain lists when NumPy is unavailable.
+    """
+
+    __slots__ = ("offer_ids", "prices", "etas")
+
+    def __init__(self, offer_ids: List[str], prices, etas):
+        self.offer_ids = offer_ids
+        self.prices = prices
+        self.etas = etas
+
+    @classmethod
+    def from_offers(cls, offers: List["NegotiationOffer"]) -> "NegotiationBatch":
+        offer_ids = [offer.offer_id for offer in offers]
+        prices = [offer.offer_price for offer in offers]
+        etas = [offer.eta_estimate for offer in offers]
+        if NUMPY_AVAILABLE:
+            prices = np.asarray(prices, dtype=np.float32)
+            etas = np.asarray(etas, dtype=np.float32)
+        return cls(offer_ids, prices, etas)
+
+    def __len__(self) -> int:
+        return len(self.offer_ids)
+
+
 class NegotiationState(BaseModel):
     """Complete state of an ongoing negotiation."""
     negotiation_id: str = Field(..., description="Unique negotiation session ID")
@@ -219,6 +275,10 @@ class NegotiationState(BaseModel):
     responses: List[NegotiationResponse] = Field(default_factory=list)
     current_round: int = Field(default=1)
     max_rounds: int = Field(default=5)
+
+    # Price currently on the table, updated as offers/counters land so the
+    # graph nodes read one scalar instead of re-deriving it from history
+    last_offer_price: Optional[float] = Field(default=None)
     
     # Outcome
     is_complete: bool = Field(default=False)
@@ -316,9 +376,11 @@ class GraphState(BaseModel):
     # Core negotiation state
     negotiation: NegotiationState
     
-    # Agent states
-    warehouse_state: WarehouseState
-    carrier_state: CarrierState
+    # Agent states (optional: the graph nodes close over the live agents,
+    # so these copies only exist for external inspection and would
+    # otherwise be re-serialized by the checkpointer on every step)
+    warehouse_state: Optional[WarehouseState] = None
+    carrier_state: Optional[CarrierState] = None
     
     # World context
     world_snapshot: Optional[WorldSnapshot] = None
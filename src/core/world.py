@@ -13,6 +13,14 @@ from src.core.schema import (
     CityNode, RouteEdge, WorldSnapshot, WeatherStatus,
     EnvironmentalState
 )
+from src.core.optional_jit import maybe_njit
+
+# NumPy powers the batch pricing helpers; scalar paths work without it
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 
 # =============================================================================
@@ -99,8 +107,17 @@ class WorldState:
         self.graph = nx.Graph()
         self.current_tick = 0
         self.created_at = datetime.now()
+        # Deterministic route/price queries are memoized here; the version
+        # counter bumps on every mutation so stale entries never survive.
+        self.version = 0
+        self._query_cache: Dict = {}
         self._initialize_texas_network()
         logger.info(f"🌍 WorldState '{name}' initialized with {self.graph.number_of_nodes()} cities and {self.graph.number_of_edges()} routes")
+
+    def _invalidate_queries(self) -> None:
+        """Invalidate memoized queries after a world mutation."""
+        self.version += 1
+        self._query_cache.clear()
     
     def _initialize_texas_network(self) -> None:
         """Initialize the Texas logistics corridor graph."""
@@ -134,10 +151,17 @@ class WorldState:
     
     def get_route(self, source: str, target: str) -> Optional[RouteEdge]:
         """Get a route edge between two cities."""
+        key = ("route", source, target)
+        if key in self._query_cache:
+            return self._query_cache[key]
+
+        route = None
         if self.graph.has_edge(source, target):
             data = self.graph.edges[source, target]
-            return RouteEdge(**data)
-        return None
+            route = RouteEdge(**data)
+
+        self._query_cache[key] = route
+        return route
     
     def get_all_cities(self) -> List[CityNode]:
         """Get all cities in the network."""
@@ -152,6 +176,15 @@ class WorldState:
         Find the shortest path between two cities.
         Returns (path_cities, total_distance)
         """
+        key = ("path", source, target)
+        if key in self._query_cache:
+            return self._query_cache[key]
+
+        result = self._shortest_path_uncached(source, target)
+        self._query_cache[key] = result
+        return result
+
+    def _shortest_path_uncached(self, source: str, target: str) -> Tuple[List[str], float]:
         try:
             path = nx.shortest_path(
                 self.graph, source, target,
@@ -194,10 +227,18 @@ class WorldState:
         """
         Estimate travel time in hours considering all factors.
         """
+        key = ("eta", source, target, avg_speed_mph)
+        if key in self._query_cache:
+            return self._query_cache[key]
+
         effective_distance = self.get_effective_distance(source, target)
         if effective_distance == float('inf'):
-            return float('inf')
-        return effective_distance / avg_speed_mph
+            eta = float('inf')
+        else:
+            eta = effective_distance / avg_speed_mph
+
+        self._query_cache[key] = eta
+        return eta
     
     # =========================================================================
     # UPDATE METHODS
@@ -207,6 +248,7 @@ class WorldState:
         """Update weather status for a route."""
         if self.graph.has_edge(source, target):
             self.graph.edges[source, target]['weather_status'] = weather
+            self._invalidate_queries()
             logger.info(f"🌦️ Weather updated on {source} ↔ {target}: {weather.value}")
             return True
         return False
@@ -216,6 +258,7 @@ class WorldState:
         if self.graph.has_edge(source, target):
             multiplier = max(0.5, min(3.0, multiplier))  # Clamp to valid range
             self.graph.edges[source, target]['fuel_multiplier'] = multiplier
+            self._invalidate_queries()
             logger.info(f"⛽ Fuel multiplier updated on {source} ↔ {target}: {multiplier:.2f}x")
             return True
         return False
@@ -225,6 +268,7 @@ class WorldState:
         if self.graph.has_edge(source, target):
             factor = max(0.5, min(2.0, factor))
             self.graph.edges[source, target]['congestion_factor'] = factor
+            self._invalidate_queries()
             logger.info(f"🚗 Congestion updated on {source} ↔ {target}: {factor:.2f}x")
             return True
         return False
@@ -233,6 +277,7 @@ class WorldState:
         """Close a route (e.g., due to severe weather)."""
         if self.graph.has_edge(source, target):
             self.graph.edges[source, target]['is_open'] = False
+            self._invalidate_queries()
             logger.warning(f"🚧 Route CLOSED: {source} ↔ {target}")
             return True
         return False
@@ -241,6 +286,7 @@ class WorldState:
         """Reopen a closed route."""
         if self.graph.has_edge(source, target):
             self.graph.edges[source, target]['is_open'] = True
+            self._invalidate_queries()
             logger.info(f"✅ Route REOPENED: {source} ↔ {target}")
             return True
         return False
@@ -374,6 +420,7 @@ class EnvironmentalChaosGenerator:
 # UTILITY FUNCTIONS
 # =============================================================================
 
+@maybe_njit(cache=True)
 def calculate_shipping_cost(
     distance: float,
     fuel_multiplier: float = 1.0,
@@ -398,6 +445,7 @@ def calculate_shipping_cost(
     return distance * base_rate_per_mile * fuel_multiplier * weight_factor
 
 
+
 def calculate_fair_price_range(
     world: WorldState,
     source: str,
@@ -407,7 +455,14 @@ def calculate_fair_price_range(
     """
     Calculate a fair price range for shipping between two cities.
     Returns (min_price, max_price)
+
+    Results are memoized on the world's query cache keyed by
+    (source, target, weight bucket) and invalidated on world mutation.
     """
+    key = ("fair_price", source, target, round(weight_kg, 1))
+    if key in world._query_cache:
+        return world._query_cache[key]
+
     route = world.get_route(source, target)
     if not route:
         # Try shortest path
@@ -426,10 +481,51 @@ def calculate_fair_price_range(
     # Add margin range
     min_price = base_cost * 0.8   # Carrier's minimum acceptable
     max_price = base_cost * 1.5   # Warehouse's maximum budget
-    
+
+    world._query_cache[key] = (min_price, max_price)
     return (min_price, max_price)
 
 
+def calculate_fair_price_range_batch(
+    distances,
+    fuel_multipliers,
+    weights_kg
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Vectorized counterpart of the pricing math in calculate_fair_price_range.
+
+    Takes parallel arrays (structure-of-arrays layout) of route distances,
+    fuel multipliers and package weights and returns (min_prices,
+    max_prices) arrays, matching the scalar formula element-for-element.
+    Route lookup stays with the caller - this only does the math.
+    """
+    if not NUMPY_AVAILABLE:
+        pairs = [
+            calculate_fair_price_range_single(d, f, w)
+            for d, f, w in zip(distances, fuel_multipliers, weights_kg)
+        ]
+        return [p[0] for p in pairs], [p[1] for p in pairs]
+
+    distances = np.asarray(distances, dtype=np.float64)
+    fuel_multipliers = np.asarray(fuel_multipliers, dtype=np.float64)
+    weights_kg = np.asarray(weights_kg, dtype=np.float64)
+
+    weight_factors = 1.0 + (weights_kg / 1000.0) * 0.5
+    base_costs = distances * 2.50 * fuel_multipliers * weight_factors
+
+    return base_costs * 0.8, base_costs * 1.5
+
+
+def calculate_fair_price_range_single(
+    distance: float,
+    fuel_multiplier: float,
+    weight_kg: float = 100.0
+) -> Tuple[float, float]:
+    """Scalar pricing math shared with the batch helper (no world lookup)."""
+    base_cost = calculate_shipping_cost(distance, fuel_multiplier, weight_kg=weight_kg)
+    return (base_cost * 0.8, base_cost * 1.5)
+
+
 # =============================================================================
 # MAIN (for testing)
 # =============================================================================